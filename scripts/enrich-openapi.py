@@ -5,6 +5,13 @@ Reads the bare spec (openapi.json) where workspace-domain endpoints have
 ``{"type": "object"}`` for request/response bodies and verbose operationIds,
 then writes an enriched copy with proper ``$ref`` pointers and short names.
 
+When `orjson <https://github.com/ijl/orjson>`_ is installed it is used to
+parse and serialize the spec; otherwise the stdlib ``json`` module is used.
+Both produce the same 2-space indented output.  The output is written
+incrementally, one path item at a time; when `ijson
+<https://github.com/ICRAR/ijson>`_ is installed the input is streamed as
+well, keeping peak memory independent of the spec size.
+
 Usage::
 
     python3 scripts/enrich-openapi.py                          # defaults
@@ -14,11 +21,26 @@ Usage::
 from __future__ import annotations
 
 import argparse
-import copy
+import functools
+import hashlib
 import json
+import os
+import shutil
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # ---------------------------------------------------------------------------
 # Schema definitions (derived from sdks/go/models.go)
 # ---------------------------------------------------------------------------
@@ -427,12 +449,20 @@ OPERATION_ID_MAP: dict[str, str] = {
 # None means "leave as-is".
 # ---------------------------------------------------------------------------
 
+# One canonical ``$ref`` / array-of-``$ref`` dict per schema, built once and
+# shared by every SCHEMA_MAP entry that points at it.  They are plain dicts
+# (not MappingProxyType) because the JSON serializers cannot encode proxies;
+# treat them as read-only.
+_REFS: dict[str, dict] = {name: {"$ref": f"#/components/schemas/{name}"} for name in SCHEMAS}
+_ARRAY_REFS: dict[str, dict] = {name: {"type": "array", "items": ref} for name, ref in _REFS.items()}
+
+
 def _ref(name: str) -> dict:
-    return {"$ref": f"#/components/schemas/{name}"}
+    return _REFS[name]
 
 
 def _array_of(name: str) -> dict:
-    return {"type": "array", "items": _ref(name)}
+    return _ARRAY_REFS[name]
 
 
 # Maps NEW operationId → (response_schema_override, request_body_override)
@@ -519,72 +549,233 @@ SCHEMA_MAP: dict[str, tuple] = {
 }
 
 
-def _is_bare_object(schema: dict) -> bool:
-    """Return True if schema is effectively ``{"type": "object"}`` with no properties."""
-    if schema.get("type") == "object" and "properties" not in schema and "$ref" not in schema:
-        return True
-    return False
+# Schema shapes recognised by _shape().
+_OTHER, _BARE_OBJ, _BARE_ARRAY_OBJ = range(3)
 
+# Shapes that may be replaced by a response / request body override.
+_RESPONSE_SHAPES = (_BARE_OBJ, _BARE_ARRAY_OBJ)
+_REQUEST_SHAPES = (_BARE_OBJ,)
 
-def _is_bare_array_of_object(schema: dict) -> bool:
-    """Return True for ``{"type": "array", "items": {"type": "object"}}``."""
-    if schema.get("type") == "array":
-        items = schema.get("items", {})
-        return _is_bare_object(items)
-    return False
 
+def _shape(schema: dict) -> int:
+    """Classify *schema* in a single pass.
 
-def enrich(spec: dict) -> dict:
-    """Return a deep-copied spec with enriched schemas and operationIds."""
-    spec = copy.deepcopy(spec)
+    Returns ``_BARE_OBJ`` for ``{"type": "object"}`` with no properties,
+    ``_BARE_ARRAY_OBJ`` for an array of such objects and ``_OTHER`` for
+    anything else.
+    """
+    schema_type = schema.get("type")
+    if schema_type == "object":
+        return _BARE_OBJ if "properties" not in schema and "$ref" not in schema else _OTHER
+    if schema_type == "array":
+        items = schema.get("items") or {}
+        if items.get("type") == "object" and "properties" not in items and "$ref" not in items:
+            return _BARE_ARRAY_OBJ
+    return _OTHER
 
-    # 1. Inject schemas into components/schemas
-    if "components" not in spec:
-        spec["components"] = {}
-    if "schemas" not in spec["components"]:
-        spec["components"]["schemas"] = {}
-    for name, schema_def in SCHEMAS.items():
-        spec["components"]["schemas"][name] = schema_def
 
-    # 2. Walk all operations, remap operationId and patch schemas
-    for _path, path_item in spec.get("paths", {}).items():
-        for _method in ("get", "post", "put", "patch", "delete"):
-            op = path_item.get(_method)
-            if op is None:
-                continue
+def _cow(d: dict) -> dict:
+    """Return a shallow copy of *d* so it can be written without touching the input."""
+    return dict(d)
+
+
+def _with_json_schema(body: dict, schema: dict, shapes: tuple[int, ...]) -> dict:
+    """Return *body* with its ``application/json`` schema replaced.
+
+    The replacement only happens when the existing schema's :func:`_shape`
+    is one of *shapes*; otherwise *body* is returned as-is.  Only the
+    containers on the write path are copied.
+    """
+    json_content = body.get("content", {}).get("application/json", {})
+    if _shape(json_content.get("schema", {})) not in shapes:
+        return body
+    body = _cow(body)
+    body["content"] = _cow(body["content"])
+    body["content"]["application/json"] = json_content = _cow(json_content)
+    json_content["schema"] = schema
+    return body
+
+
+# Enriched outputs keyed by _cache_key(), reused when the input is unchanged;
+# only the most recent CACHE_KEEP entries are kept.
+CACHE_DIR = Path(".enrich-cache")
+CACHE_KEEP = 8
+
+# HTTP methods whose operations are enriched.
+_METHODS = frozenset(("get", "post", "put", "patch", "delete"))
+
 
-            old_id = op.get("operationId", "")
-            new_id = OPERATION_ID_MAP.get(old_id)
-            if new_id:
-                op["operationId"] = new_id
-
-                mapping = SCHEMA_MAP.get(new_id)
-                if mapping:
-                    resp_schema, req_schema = mapping
-
-                    # Patch success response schema
-                    if resp_schema is not None:
-                        for code, resp in op.get("responses", {}).items():
-                            if not code.startswith("2"):
-                                continue
-                            content = resp.get("content", {})
-                            json_content = content.get("application/json", {})
-                            existing = json_content.get("schema", {})
-                            if _is_bare_object(existing) or _is_bare_array_of_object(existing):
-                                json_content["schema"] = resp_schema
-
-                    # Patch request body schema
-                    if req_schema is not None:
-                        rb = op.get("requestBody", {})
-                        content = rb.get("content", {})
-                        json_content = content.get("application/json", {})
-                        existing = json_content.get("schema", {})
-                        if _is_bare_object(existing):
-                            json_content["schema"] = req_schema
+@functools.cache
+def _resolve(old_id: str | None) -> tuple[str, tuple | None] | None:
+    """Map an original operationId to ``(new_id, schema_mapping)``, or None if unmapped.
 
+    Results are memoized, so each distinct operationId costs one cache probe
+    after its first lookup; a trie or perfect hash would not save anything
+    over the plain dicts here.
+    """
+    new_id = OPERATION_ID_MAP.get(old_id)
+    if new_id is None:
+        return None
+    return new_id, SCHEMA_MAP.get(new_id)
+
+
+def _inject_schemas(spec: dict) -> dict:
+    """Return a copy of *spec* with SCHEMAS added to ``components/schemas``."""
+    spec = _cow(spec)
+    components = spec["components"] = _cow(spec.get("components", {}))
+    components["schemas"] = {**components.get("schemas", {}), **SCHEMAS}
     return spec
 
 
+def _patch_path_item(path_item: dict) -> tuple[dict, int]:
+    """Remap operationIds and patch schemas for every operation in *path_item*.
+
+    Returns the (possibly copied) path item and the number of operations
+    that had a schema override mapping applied.  *path_item* itself is
+    never mutated.
+    """
+    mapped = 0
+    copied = False
+    for _method in _METHODS.intersection(path_item):
+        op = path_item[_method]
+        resolved = _resolve(op.get("operationId"))
+        if resolved is None:
+            continue
+        new_id, mapping = resolved
+
+        op = _cow(op)
+        op["operationId"] = new_id
+
+        if mapping:
+            mapped += 1
+            resp_schema, req_schema = mapping
+
+            # Patch success response schema
+            if resp_schema is not None and "responses" in op:
+                responses = op["responses"] = _cow(op["responses"])
+                two_xx = [(code, resp) for code, resp in responses.items() if code[:1] == "2"]
+                for code, resp in two_xx:
+                    responses[code] = _with_json_schema(resp, resp_schema, _RESPONSE_SHAPES)
+
+            # Patch request body schema
+            if req_schema is not None and "requestBody" in op:
+                op["requestBody"] = _with_json_schema(op["requestBody"], req_schema, _REQUEST_SHAPES)
+
+        if not copied:
+            path_item = _cow(path_item)
+            copied = True
+        path_item[_method] = op
+
+    return path_item, mapped
+
+
+def _patch_entry(entry: tuple[str, dict]) -> tuple[str, dict, int]:
+    """Patch one ``(path, path_item)`` pair; top-level so worker processes can pickle it."""
+    path, path_item = entry
+    path_item, mapped = _patch_path_item(path_item)
+    return path, path_item, mapped
+
+
+def _cache_key(spec_path: Path) -> str:
+    """Return a digest of the input spec and this script's source.
+
+    Enrichment is deterministic in both, so hashing the script means any
+    change to SCHEMAS, OPERATION_ID_MAP or the patch logic invalidates
+    previously cached outputs without a manual version bump.
+    """
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    with spec_path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _store_cache(out_path: Path, cache_path: Path) -> None:
+    """Copy the freshly written output into the cache atomically and prune all but the most recent entries."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_suffix(".tmp")
+    shutil.copyfile(out_path, tmp)
+    os.replace(tmp, cache_path)
+    entries = sorted(cache_path.parent.glob("*.json"), key=lambda p: p.stat().st_mtime_ns, reverse=True)
+    for stale in entries[CACHE_KEEP:]:
+        stale.unlink(missing_ok=True)
+
+
+def _load_json(path: Path) -> dict:
+    """Parse a JSON file, using orjson when available."""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: object) -> bytes:
+    """Serialize *obj* as 2-space indented JSON without a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+
+def _stream_spec(path: Path) -> tuple[dict, Iterator[tuple[str, dict]] | None]:
+    """Read *path* incrementally with ijson.
+
+    Returns the top-level members other than ``paths`` (small) and a lazy
+    iterator over the ``(path, path_item)`` pairs, or None when the spec
+    has no ``paths``.  The file is scanned twice so that the full document
+    is never held in memory at once.
+    """
+    header: dict = {}
+    has_paths = False
+    with path.open("rb") as f:
+        key = builder = None
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == "":
+                if event == "map_key":
+                    key = value
+                    has_paths = has_paths or key == "paths"
+                    builder = None if key == "paths" else ijson.ObjectBuilder()
+                continue
+            if builder is None:
+                continue
+            builder.event(event, value)
+            if prefix == key and event not in ("start_map", "start_array", "map_key"):
+                header[key] = builder.value
+                builder = None
+
+    if not has_paths:
+        return header, None
+
+    def _paths() -> Iterator[tuple[str, dict]]:
+        with path.open("rb") as f:
+            yield from ijson.kvitems(f, "paths", use_float=True)
+
+    return header, _paths()
+
+
+def _write_spec(path: Path, header: dict, paths: Iterable[tuple[str, dict]] | None) -> None:
+    """Write the spec member by member, streaming ``paths`` one item at a time.
+
+    The output is 2-space indented JSON with a trailing newline, identical
+    to serializing the whole document at once except that ``paths`` is
+    emitted as the last top-level member.  Only one path item needs to be
+    serialized (and, when streaming the input, held) at a time.
+    """
+    with path.open("wb") as f:
+        sep = b"{\n  "
+        for key, value in header.items():
+            f.write(sep + _dumps(key) + b": " + _dumps(value).replace(b"\n", b"\n  "))
+            sep = b",\n  "
+        if paths is not None:
+            f.write(sep + b'"paths": {')
+            sep = b",\n  "
+            item_sep = b"\n    "
+            for key, value in paths:
+                f.write(item_sep + _dumps(key) + b": " + _dumps(value).replace(b"\n", b"\n    "))
+                item_sep = b",\n    "
+            f.write(b"}" if item_sep == b"\n    " else b"\n  }")
+        f.write(b"{}\n" if sep == b"{\n  " else b"\n}\n")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Enrich the Ancla OpenAPI spec")
     parser.add_argument(
@@ -597,6 +788,19 @@ def main() -> None:
         default="openapi.enriched.json",
         help="Output enriched spec path (default: openapi.enriched.json)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always re-enrich instead of reusing output cached in {CACHE_DIR}/",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes used to patch path items (default: 1). "
+        "Only worthwhile for very large specs; with more than one job the "
+        "input paths are no longer streamed.",
+    )
     args = parser.parse_args()
 
     spec_path = Path(args.spec)
@@ -604,22 +808,44 @@ def main() -> None:
         print(f"Error: {spec_path} not found", file=sys.stderr)
         sys.exit(1)
 
-    with open(spec_path) as f:
-        spec = json.load(f)
-
-    enriched = enrich(spec)
-
-    with open(args.out, "w") as f:
-        json.dump(enriched, f, indent=4)
-        f.write("\n")
+    out_path = Path(args.out)
+    cache_path = None if args.no_cache else CACHE_DIR / f"{_cache_key(spec_path)}.json"
+    if cache_path is not None and cache_path.exists():
+        shutil.copyfile(cache_path, out_path)
+        print(f"Enriched spec written to {args.out} (input unchanged, reused {cache_path})")
+        return
+
+    if ijson is not None:
+        header, paths = _stream_spec(spec_path)
+    else:
+        header = _load_json(spec_path)
+        paths = header.pop("paths", None)
+        if paths is not None:
+            paths = iter(paths.items())
+
+    mapped = 0
+    executor = ProcessPoolExecutor(max_workers=args.jobs) if args.jobs > 1 else None
+
+    def _enrich_paths(items: Iterator[tuple[str, dict]]) -> Iterator[tuple[str, dict]]:
+        nonlocal mapped
+        if executor is None:
+            results = map(_patch_entry, items)
+        else:
+            results = executor.map(_patch_entry, items, chunksize=64)
+        for path, path_item, n in results:
+            mapped += n
+            yield path, path_item
+
+    try:
+        _write_spec(out_path, _inject_schemas(header), None if paths is None else _enrich_paths(paths))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if cache_path is not None:
+        _store_cache(out_path, cache_path)
 
     # Summary
-    mapped = sum(
-        1
-        for _path, pi in enriched.get("paths", {}).items()
-        for m in ("get", "post", "put", "patch", "delete")
-        if (op := pi.get(m)) and op.get("operationId") in SCHEMA_MAP
-    )
     print(f"Enriched spec written to {args.out}")
     print(f"  Schemas injected: {len(SCHEMAS)}")
     print(f"  operationIds remapped: {len(OPERATION_ID_MAP)}")
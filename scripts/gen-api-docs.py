@@ -2,19 +2,44 @@
 """Generate Starlight-compatible API reference markdown from openapi.json.
 
 Usage:
-    python scripts/gen-api-docs.py [--spec openapi.json] [--out docs/src/content/docs/api]
+    python scripts/gen-api-docs.py [--spec openapi.json] [--out docs/src/content/docs/api] [--no-cache] [--jobs N]
+
+Uses orjson for JSON parsing and example rendering when it is installed,
+falling back to the stdlib json module with identical output.
 """
 
+import hashlib
 import json
+import os
+import re
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 SPEC_PATH = Path("openapi.json")
 OUT_DIR = Path("docs/src/content/docs/api")
 
+# Rendered pages are cached here, keyed on the spec's and this script's
+# (mtime, size); only the most recent CACHE_KEEP entries are kept.
+CACHE_DIR = Path(".gen-api-docs-cache")
+CACHE_KEEP = 8
+
+# Endpoint order within a page: list/get before create/update/delete.
+_METHOD_ORDER = {"get": 0, "post": 1, "put": 2, "patch": 3, "delete": 4}
+
 # Tags to skip (admin, internal endpoints)
-SKIP_TAGS = {"untagged"}
+SKIP_TAGS = frozenset({"untagged"})
+_UNTAGGED = ("untagged",)
+
+# Path-item keys that are not HTTP operations.
+_NON_OP_KEYS = frozenset({"parameters", "servers", "summary", "description", "$ref"})
 
 # Map tag names to URL-friendly slugs and display labels
 TAG_META = {
@@ -40,9 +65,25 @@ TAG_META = {
 }
 
 
+def _loads(data):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_indent(obj):
+    """Serialize obj as 2-space indented JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
 def parse_args():
     spec = SPEC_PATH
     out = OUT_DIR
+    use_cache = True
+    jobs = 1
     args = sys.argv[1:]
     i = 0
     while i < len(args):
@@ -52,28 +93,92 @@ def parse_args():
         elif args[i] == "--out" and i + 1 < len(args):
             out = Path(args[i + 1])
             i += 2
+        elif args[i] == "--no-cache":
+            use_cache = False
+            i += 1
+        elif args[i] == "--jobs" and i + 1 < len(args):
+            jobs = int(args[i + 1])
+            i += 2
         else:
             i += 1
-    return spec, out
+    return spec, out, use_cache, jobs
+
+
+# Memoized lookups for the spec currently being rendered; cleared by main().
+# Examples are keyed by (id(schema), depth) and store the schema alongside
+# the example so a recycled id can never return a stale entry.
+_REF_CACHE = {}
+_EXAMPLE_CACHE = {}
 
 
 def resolve_ref(spec, ref):
     """Resolve a $ref pointer like '#/components/schemas/Foo'."""
+    try:
+        return _REF_CACHE[ref]
+    except KeyError:
+        pass
     parts = ref.lstrip("#/").split("/")
     obj = spec
     for p in parts:
         obj = obj.get(p, {})
+    _REF_CACHE[ref] = obj
     return obj
 
 
-def schema_to_json_example(spec, schema, depth=0):
-    """Generate a JSON example from a schema, resolving $ref."""
+def dereference(spec):
+    """Replace every local ``{"$ref": "#/..."}`` node in spec with its target, in place.
+
+    Run once after loading so rendering never walks JSON pointers.  Targets
+    are shared rather than copied, which keeps recursive schemas finite
+    (schema_to_json_example's depth cap bounds their expansion); a set of
+    visited node ids keeps the walk itself from looping.
+    """
+    visited = set()
+    stack = [spec]
+    while stack:
+        node = stack.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        for key, value in node.items() if isinstance(node, dict) else enumerate(node):
+            if isinstance(value, dict):
+                value = node[key] = _follow_refs(spec, value)
+            elif not isinstance(value, list):
+                continue
+            stack.append(value)
+    return spec
+
+
+def _follow_refs(spec, node):
+    """Return the object a (possibly chained) local $ref node points to."""
+    seen = set()
+    while isinstance(node.get("$ref"), str) and node["$ref"].startswith("#/") and id(node) not in seen:
+        seen.add(id(node))
+        node = resolve_ref(spec, node["$ref"])
+    return node
+
+
+def schema_to_json_example(schema, depth=0):
+    """Generate a JSON example from a dereferenced schema.
+
+    Examples are cached per schema object and depth, so component schemas
+    shared by many endpoints are only expanded once.  The returned value
+    may be shared between callers and must not be mutated.
+    """
     if depth > 4:
         return "..."
 
-    if "$ref" in schema:
-        schema = resolve_ref(spec, schema["$ref"])
+    key = (id(schema), depth)
+    cached = _EXAMPLE_CACHE.get(key)
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+    example = _build_example(schema, depth)
+    _EXAMPLE_CACHE[key] = (schema, example)
+    return example
+
 
+def _build_example(schema, depth):
+    """Build the example for an already-resolved schema."""
     if "example" in schema:
         return schema["example"]
 
@@ -85,11 +190,11 @@ def schema_to_json_example(spec, schema, depth=0):
             return {}
         result = {}
         for name, prop in props.items():
-            result[name] = schema_to_json_example(spec, prop, depth + 1)
+            result[name] = schema_to_json_example(prop, depth + 1)
         return result
     elif schema_type == "array":
         items = schema.get("items", {})
-        return [schema_to_json_example(spec, items, depth + 1)]
+        return [schema_to_json_example(items, depth + 1)]
     elif schema_type == "string":
         if schema.get("format") == "uuid":
             return "uuid"
@@ -113,9 +218,12 @@ def format_path(path):
     return path.removeprefix("/api/v1")
 
 
-def generate_endpoint_section(spec, method, path, operation):
-    """Generate markdown for a single endpoint."""
-    lines = []
+def emit_endpoint_section(method, path, operation, lines):
+    """Append the markdown lines for a single endpoint to lines.
+
+    Appending into the page's line buffer means each page is joined exactly
+    once, instead of joining every section and then the page again.
+    """
     op_id = operation.get("operationId", operation.get("summary", ""))
     summary = operation.get("summary", op_id)
     description = operation.get("description", "")
@@ -171,12 +279,12 @@ def generate_endpoint_section(spec, method, path, operation):
         json_content = content.get("application/json", {})
         schema = json_content.get("schema", {})
         if schema:
-            example = schema_to_json_example(spec, schema)
+            example = schema_to_json_example(schema)
             if example:
                 lines.append("**Request body:**")
                 lines.append("")
                 lines.append("```json")
-                lines.append(json.dumps(example, indent=2))
+                lines.append(_dumps_indent(example))
                 lines.append("```")
                 lines.append("")
 
@@ -188,96 +296,165 @@ def generate_endpoint_section(spec, method, path, operation):
         resp_content = resp.get("content", {}).get("application/json", {})
         schema = resp_content.get("schema", {})
         if schema:
-            example = schema_to_json_example(spec, schema)
+            example = schema_to_json_example(schema)
             if example and example != "...":
                 lines.append("**Response:**")
                 lines.append("")
                 lines.append("```json")
-                lines.append(json.dumps(example, indent=2))
+                lines.append(_dumps_indent(example))
                 lines.append("```")
                 lines.append("")
 
-    return "\n".join(lines)
+
+# Marker identifying generated pages, and how far into a page to look for it.
+_MARKER = b"Auto-generated from openapi.json"
+_MARKER_SCAN_BYTES = 1024
+
+# A leading run without capitals, then one word per capital letter.
+_CAMEL_RE = re.compile(r"[^A-Z]+|[A-Z][^A-Z]*")
 
 
 def _split_camel(s):
-    """Split CamelCase into words."""
-    words = []
-    current = []
-    for c in s:
-        if c.isupper() and current:
-            words.append("".join(current))
-            current = [c]
-        else:
-            current.append(c)
-    if current:
-        words.append("".join(current))
-    return words
+    """Split CamelCase into words, breaking before every capital letter."""
+    return _CAMEL_RE.findall(s)
+
+
+def render_tag(tag, endpoints):
+    """Render the reference page for one tag as ``(filename, markdown)``."""
+    slug, label = TAG_META.get(tag, (tag.lower(), tag))
+
+    marker = f"<!-- {_MARKER.decode()} — do not edit manually -->"
+    lines = [
+        "---",
+        f'title: "{label}"',
+        f"description: API reference for {label.lower()} endpoints.",
+        "---",
+        "",
+        marker,
+        "",
+    ]
+
+    # Sort endpoints: list/get before create/update/delete, then by path.
+    # Entries carry their method rank, so the key is a C-level itemgetter.
+    endpoints.sort(key=itemgetter(0, 1))
+
+    for _rank, path, method, operation in endpoints:
+        emit_endpoint_section(method, path, operation, lines)
+        lines.append("")
 
+    # Stamp the page with a hash of its content, right below the marker, so
+    # main() can tell from the head of an existing file whether it changed.
+    digest = hashlib.blake2b("\n".join(lines).encode(), digest_size=16).hexdigest()
+    lines.insert(lines.index(marker) + 1, f"<!-- hash:{digest} -->")
+    return f"{slug}.md", "\n".join(lines)
 
-def main():
-    spec_path, out_dir = parse_args()
 
-    with open(spec_path) as f:
-        spec = json.load(f)
+def _render_tag_item(item):
+    """Render one ``(tag, endpoints)`` pair; top-level so worker processes can pickle it."""
+    return render_tag(*item)
 
+
+def render_pages(spec, jobs=1):
+    """Render the reference pages for a dereferenced spec.
+
+    Returns a list of ``(filename, markdown)`` pairs, one per tag, in write
+    order; tags that share a slug overwrite each other like before.  With
+    ``jobs > 1`` tags are rendered in parallel worker processes.
+    """
     # Group endpoints by tag
     by_tag = defaultdict(list)
     for path, methods in spec.get("paths", {}).items():
         if not path.startswith("/api/v1"):
             continue
         for method, operation in methods.items():
-            if method in ("parameters", "servers"):
+            if method in _NON_OP_KEYS:
                 continue
-            tags = operation.get("tags", ["untagged"])
+            tags = operation.get("tags", _UNTAGGED)
             for tag in tags:
                 if tag not in SKIP_TAGS:
-                    by_tag[tag].append((method, path, operation))
+                    by_tag[tag].append((_METHOD_ORDER.get(method, 5), path, method, operation))
+
+    tags = sorted(by_tag.items())
+    if jobs <= 1:
+        return [render_tag(tag, endpoints) for tag, endpoints in tags]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(_render_tag_item, tags))
+
+
+def _cache_key(spec_path):
+    """Key rendered pages on the (mtime, size) of the spec and of this script."""
+    stamp = []
+    for path in (Path(spec_path), Path(__file__)):
+        st = path.stat()
+        stamp.append(f"{path.resolve()}:{st.st_mtime_ns}:{st.st_size}")
+    return hashlib.blake2b("\n".join(stamp).encode(), digest_size=16).hexdigest()
+
+
+def _read_cache(cache_path):
+    """Return cached pages, or None on a miss or unreadable entry."""
+    try:
+        return [tuple(page) for page in _loads(cache_path.read_bytes())]
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(cache_path, pages):
+    """Store pages atomically and prune all but the most recent entries."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(pages, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, cache_path)
+    entries = sorted(cache_path.parent.glob("*.json"), key=lambda p: p.stat().st_mtime_ns, reverse=True)
+    for stale in entries[CACHE_KEEP:]:
+        stale.unlink(missing_ok=True)
+
+
+def main():
+    spec_path, out_dir, use_cache, jobs = parse_args()
+
+    cache_path = CACHE_DIR / f"{_cache_key(spec_path)}.json" if use_cache else None
+    pages = _read_cache(cache_path) if cache_path else None
+    if pages is None:
+        _REF_CACHE.clear()
+        _EXAMPLE_CACHE.clear()
+        spec = dereference(_loads(Path(spec_path).read_bytes()))
+        pages = render_pages(spec, jobs)
+        if cache_path:
+            _write_cache(cache_path, pages)
 
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    # Determine which files will be generated so we can remove stale ones.
-    generated_slugs = set()
-    for tag in by_tag:
-        slug, _ = TAG_META.get(tag, (tag.lower(), tag))
-        generated_slugs.add(f"{slug}.md")
+    # Tags that share a slug overwrite each other; the last one wins.
+    pages_by_name = dict(pages)
+    unchanged = set()
 
     # Remove stale generated files, but keep index.md and hand-written pages.
     for f in out_dir.glob("*.md"):
         if f.name == "index.md":
             continue
-        # Only remove files that are auto-generated (contain the marker comment).
-        content = f.read_text()
-        if "Auto-generated from openapi.json" in content:
+        # Only touch files that are auto-generated (the marker and hash
+        # comments sit right after the frontmatter, so the head is enough).
+        with f.open("rb") as fh:
+            head = fh.read(_MARKER_SCAN_BYTES)
+        if _MARKER not in head:
+            continue
+        text = pages_by_name.get(f.name)
+        if text is None:
             f.unlink()
-
-    count = 0
-    for tag, endpoints in sorted(by_tag.items()):
-        slug, label = TAG_META.get(tag, (tag.lower(), tag))
-        filepath = out_dir / f"{slug}.md"
-
-        lines = [
-            "---",
-            f'title: "{label}"',
-            f"description: API reference for {label.lower()} endpoints.",
-            "---",
-            "",
-            f"<!-- Auto-generated from openapi.json — do not edit manually -->",
-            "",
-        ]
-
-        # Sort endpoints: list/get before create/update/delete
-        method_order = {"get": 0, "post": 1, "put": 2, "patch": 3, "delete": 4}
-        endpoints.sort(key=lambda e: (method_order.get(e[0], 5), e[1]))
-
-        for method, path, operation in endpoints:
-            lines.append(generate_endpoint_section(spec, method, path, operation))
-            lines.append("")
-
-        filepath.write_text("\n".join(lines))
-        count += 1
-
-    print(f"Generated {count} API reference pages in {out_dir}")
+            continue
+        # Same size and same head, hash comment included, means the same
+        # page: leave it alone so its mtime does not trigger a rebuild.
+        data = text.encode("utf-8")
+        if len(data) == f.stat().st_size and data.startswith(head):
+            unchanged.add(f.name)
+
+    # Pages are encoded once and written as UTF-8 bytes, independent of the
+    # locale's default encoding and newline translation.
+    for filename, text in pages_by_name.items():
+        if filename not in unchanged:
+            (out_dir / filename).write_bytes(text.encode("utf-8"))
+
+    print(f"Generated {len(pages)} API reference pages in {out_dir} ({len(unchanged)} unchanged)")
 
 
 if __name__ == "__main__":
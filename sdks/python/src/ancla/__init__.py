@@ -1,35 +1,78 @@
-"""Ancla SDK -- Python client for the Ancla PaaS platform."""
-
-from ancla.client import AnclaClient
-from ancla.exceptions import (
-    AnclaError,
-    AuthenticationError,
-    NotFoundError,
-    ServerError,
-    ValidationError,
-)
-from ancla.models import (
-    Build,
-    BuildList,
-    BuildResult,
-    ConfigVar,
-    Deploy,
-    DeployList,
-    DeployLog,
-    DeployResult,
-    Environment,
-    PipelineStatus,
-    Project,
-    ScaleResult,
-    Service,
-    StageStatus,
-    Workspace,
-    WorkspaceMember,
-)
+"""Ancla SDK -- Python client for the Ancla PaaS platform.
+
+Public names are resolved lazily (PEP 562), so ``import ancla`` stays cheap
+and httpx/pydantic are only imported once a client, model or exception is
+first used.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ancla.client import AnclaClient, AsyncAnclaClient
+    from ancla.exceptions import (
+        AnclaError,
+        AuthenticationError,
+        NotFoundError,
+        ServerError,
+        ValidationError,
+    )
+    from ancla.models import (
+        Build,
+        BuildList,
+        BuildResult,
+        ConfigVar,
+        Deploy,
+        DeployList,
+        DeployLog,
+        DeployResult,
+        Environment,
+        PipelineStatus,
+        Project,
+        ScaleResult,
+        Service,
+        ServiceUpdate,
+        StageStatus,
+        Workspace,
+        WorkspaceMember,
+    )
+
+_LAZY: dict[str, str] = {
+    "AnclaClient": "ancla.client",
+    "AsyncAnclaClient": "ancla.client",
+    "AnclaError": "ancla.exceptions",
+    "AuthenticationError": "ancla.exceptions",
+    "NotFoundError": "ancla.exceptions",
+    "ServerError": "ancla.exceptions",
+    "ValidationError": "ancla.exceptions",
+    "Build": "ancla.models",
+    "BuildList": "ancla.models",
+    "BuildResult": "ancla.models",
+    "ConfigVar": "ancla.models",
+    "Deploy": "ancla.models",
+    "DeployList": "ancla.models",
+    "DeployLog": "ancla.models",
+    "DeployResult": "ancla.models",
+    "Environment": "ancla.models",
+    "PipelineStatus": "ancla.models",
+    "Project": "ancla.models",
+    "ScaleResult": "ancla.models",
+    "Service": "ancla.models",
+    "ServiceUpdate": "ancla.models",
+    "StageStatus": "ancla.models",
+    "Workspace": "ancla.models",
+    "WorkspaceMember": "ancla.models",
+}
+
+# Submodules, reachable as ``ancla.models`` etc. without importing them first.
+_SUBMODULES = frozenset({"client", "exceptions", "models"})
 
 __all__ = [
     "AnclaClient",
     "AnclaError",
+    "AsyncAnclaClient",
     "AuthenticationError",
     "Build",
     "BuildList",
@@ -46,8 +89,24 @@ __all__ = [
     "ScaleResult",
     "ServerError",
     "Service",
+    "ServiceUpdate",
     "StageStatus",
     "ValidationError",
     "Workspace",
     "WorkspaceMember",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return import_module(f"ancla.{name}")  # importing binds it on the package
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_SUBMODULES})
@@ -1,11 +1,27 @@
-"""Synchronous HTTP client for the Ancla PaaS API."""
+"""Synchronous and asynchronous HTTP clients for the Ancla PaaS API."""
 
 from __future__ import annotations
 
+import itertools
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Generator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from typing import Any
 
 import httpx
+from pydantic import ConfigDict, TypeAdapter
+
+try:
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional (``pip install ancla-sdk[orjson]``)
+    from json import loads as _json_loads
+
+    _json_dumps = None
 
 from ancla.exceptions import (
     AnclaError,
@@ -25,13 +41,196 @@ from ancla.models import (
     Environment,
     Project,
     Service,
+    ServiceUpdate,
     Workspace,
 )
 
 _DEFAULT_SERVER = "https://ancla.dev"
 
+# HTTP/2 lets concurrent requests share one connection; httpx needs the
+# optional ``h2`` package for it (``pip install ancla-sdk[http2]``).
+_HTTP2 = find_spec("h2") is not None
+# Concurrent requests issued by the sync bulk helpers (set_configs etc.),
+# matching the number of keep-alive connections in the pool.
+_FANOUT = 20
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+# Rate-limited requests (429) are always retried; these gateway errors only
+# for idempotent methods, since the server may already have acted on them.
+# Retry-After (in seconds) is honoured, otherwise the delay doubles.
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_RETRY_BACKOFF = 0.5
+_RETRY_MAX_DELAY = 30.0
+
+# Failures to establish a connection, retried for every method since the
+# request never reached the server.  This is done in the request loop rather
+# than by an explicit HTTPTransport(retries=...), because httpx ignores the
+# proxy environment variables whenever a transport is passed.
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+# Exception raised for specific error statuses; other 5xx map to
+# ServerError and everything else to AnclaError.
+_STATUS_EXC: dict[int, type[AnclaError]] = {
+    401: AuthenticationError,
+    404: NotFoundError,
+    422: ValidationError,
+}
+
+# Sent with every request.  Accept-Encoding is left to httpx, which only
+# advertises the codings it can decode (gzip and deflate, plus br/zstd when
+# the brotli/zstandard packages are installed).
+_DEFAULT_HEADERS = {"Accept": "application/json"}
+
+# Sent with request bodies that were pre-encoded by orjson.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Page size the builds endpoint uses by default, and the largest one
+# iter_builds assumes every server honours.  Above it a server may clamp
+# per_page, so the first page's length is taken as the page size instead.
+_BUILDS_PER_PAGE = 20
+
+# GET responses carrying an ETag or Last-Modified header are kept (LRU) so
+# repeat requests can be sent conditionally and answered with a bodiless 304.
+_CONDITIONAL_CACHE_SIZE = 128
+
+# Validators for list responses, built once (on first use) so each list is
+# parsed and validated in a single pydantic-core call.
+_DEFERRED = ConfigDict(defer_build=True)
+_WORKSPACE_LIST = TypeAdapter(list[Workspace], config=_DEFERRED)
+_PROJECT_LIST = TypeAdapter(list[Project], config=_DEFERRED)
+_ENVIRONMENT_LIST = TypeAdapter(list[Environment], config=_DEFERRED)
+_SERVICE_LIST = TypeAdapter(list[Service], config=_DEFERRED)
+_CONFIG_VAR_LIST = TypeAdapter(list[ConfigVar], config=_DEFERRED)
+
+
+def _env_base(ws: str, proj: str) -> str:
+    return f"/workspaces/{ws}/projects/{proj}/envs"
+
+
+def _svc_base(ws: str, proj: str, env: str) -> str:
+    return f"/workspaces/{ws}/projects/{proj}/envs/{env}/services"
+
+
+async def _async_sleep(delay: float) -> None:
+    # anyio (an httpx dependency) sleeps on asyncio and trio alike; it is
+    # imported here so that sync-only users never load it.
+    import anyio
+
+    await anyio.sleep(delay)
+
+
+class _APIKeyAuth(httpx.Auth):
+    """Attach the API key to each outgoing request."""
+
+    def __init__(self, api_key: str) -> None:
+        self.api_key = api_key
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        request.headers["X-API-Key"] = self.api_key
+        yield request
+
+
+class _BaseClient:
+    """Configuration, conditional-GET cache and error handling shared by both clients."""
+
+    def __init__(self, api_key: str | None, server: str | None, max_retries: int) -> None:
+        self.api_key = api_key or os.environ.get("ANCLA_API_KEY", "")
+        self.max_retries = max_retries
+        self.server = (server or os.environ.get("ANCLA_SERVER") or _DEFAULT_SERVER).rstrip("/")
+        self._conditional: OrderedDict[str, httpx.Response] = OrderedDict()
+        self._conditional_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _client_options(self, timeout: float) -> dict[str, Any]:
+        """Keyword arguments for the underlying ``httpx`` client."""
+        return {
+            "base_url": f"{self.server}/api/v1",
+            "auth": _APIKeyAuth(self.api_key) if self.api_key else None,
+            "headers": _DEFAULT_HEADERS,
+            "timeout": timeout,
+        }
 
-class AnclaClient:
+    def _retry_delay(self, method: str, response: httpx.Response | None, attempt: int) -> float | None:
+        """Seconds to wait before retrying, or None if *response* is final.
+
+        *response* is None when the connection could not be established.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if response is not None:
+            status = response.status_code
+            if status != 429 and not (status in _RETRY_STATUSES and method in _IDEMPOTENT_METHODS):
+                return None
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), _RETRY_MAX_DELAY)
+        return min(_RETRY_BACKOFF * 2**attempt, _RETRY_MAX_DELAY)
+
+    def _conditional_headers(self, method: str, key: str) -> tuple[httpx.Response | None, dict[str, str] | None]:
+        """Return the cached response for a GET and the validator headers to send with it.
+
+        The same response must be handed to :meth:`_revalidate`, since
+        another thread may evict it from the cache in the meantime.
+        """
+        if method != "GET":
+            return None, None
+        with self._conditional_lock:
+            cached = self._conditional.get(key)
+        if cached is None:
+            return None, None
+        headers = {}
+        if etag := cached.headers.get("ETag"):
+            headers["If-None-Match"] = etag
+        if last_modified := cached.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = last_modified
+        return cached, headers
+
+    def _revalidate(
+        self, method: str, key: str, response: httpx.Response, cached: httpx.Response | None
+    ) -> httpx.Response:
+        """Swap a 304 for the *cached* response, or cache a fresh GET response."""
+        if method != "GET":
+            return response
+        with self._conditional_lock:
+            if response.status_code == 304:
+                if cached is not None:
+                    if self._conditional.get(key) is cached:
+                        self._conditional.move_to_end(key)
+                    return cached
+            elif response.status_code == 200 and ("ETag" in response.headers or "Last-Modified" in response.headers):
+                self._conditional[key] = response
+                self._conditional.move_to_end(key)
+                if len(self._conditional) > _CONDITIONAL_CACHE_SIZE:
+                    self._conditional.popitem(last=False)
+        return response
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response) -> None:
+        """Map HTTP error codes to SDK exceptions."""
+        status = response.status_code
+        content = response.content
+        detail: str | None = None
+        # Only a JSON object can carry message/detail; anything else (HTML
+        # error pages, plain text, empty bodies) is reported as raw text.
+        if content[:1] == b"{":
+            try:
+                body = _json_loads(content)
+                detail = body.get("message") or body.get("detail")
+            except ValueError:
+                detail = response.text or None
+        else:
+            detail = response.text or None
+
+        message = detail or f"API request failed ({status})"
+        exc = _STATUS_EXC.get(status) or (ServerError if status >= 500 else AnclaError)
+        raise exc(message, status_code=status, detail=detail)
+
+
+class AnclaClient(_BaseClient):
     """Client for the Ancla PaaS REST API.
 
     Args:
@@ -41,6 +240,18 @@ class AnclaClient:
             ``ANCLA_SERVER`` environment variable, then to
             ``https://ancla.dev``.
         timeout: Request timeout in seconds.
+        transport: Custom ``httpx`` transport, e.g. ``httpx.MockTransport``
+            in tests.  Replaces the default pooled transport, and with it
+            the proxy settings read from ``HTTP_PROXY``/``HTTPS_PROXY``.
+        max_retries: How often to retry a request that failed to connect,
+            was rate limited (429) or, for idempotent methods, hit a
+            502/503/504.  ``Retry-After`` is honoured.
+
+    Connections are pooled and kept alive across calls.  When the optional
+    ``h2`` package is installed (``ancla-sdk[http2]``) requests use HTTP/2.
+    GET responses that carry an ``ETag`` or ``Last-Modified`` header are
+    remembered, and repeat requests are sent conditionally so an unchanged
+    resource comes back as a bodiless ``304``.
     """
 
     def __init__(
@@ -48,24 +259,11 @@ class AnclaClient:
         api_key: str | None = None,
         server: str | None = None,
         timeout: float = 30.0,
+        transport: httpx.BaseTransport | None = None,
+        max_retries: int = 2,
     ) -> None:
-        self.api_key = api_key or os.environ.get("ANCLA_API_KEY", "")
-        self.server = (server or os.environ.get("ANCLA_SERVER") or _DEFAULT_SERVER).rstrip("/")
-        self._client = httpx.Client(
-            base_url=f"{self.server}/api/v1",
-            headers=self._build_headers(),
-            timeout=timeout,
-        )
-
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
-
-    def _build_headers(self) -> dict[str, str]:
-        headers: dict[str, str] = {}
-        if self.api_key:
-            headers["X-API-Key"] = self.api_key
-        return headers
+        super().__init__(api_key, server, max_retries)
+        self._client = httpx.Client(transport=transport, http2=_HTTP2, limits=_LIMITS, **self._client_options(timeout))
 
     def _request(
         self,
@@ -73,35 +271,34 @@ class AnclaClient:
         path: str,
         *,
         json: Any | None = None,
+        params: dict[str, Any] | None = None,
     ) -> httpx.Response:
         """Perform an HTTP request and raise on error status codes."""
-        response = self._client.request(method, path, json=json)
+        key = str(httpx.URL(path, params=params))
+        cached, headers = self._conditional_headers(method, key)
+        content = None
+        if json is not None and _json_dumps is not None:
+            content, json, headers = _json_dumps(json), None, _JSON_HEADERS
+        for attempt in itertools.count():
+            try:
+                response = self._client.request(
+                    method, path, content=content, json=json, params=params, headers=headers
+                )
+            except _CONNECT_ERRORS:
+                delay = self._retry_delay(method, None, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(method, response, attempt)
+                if delay is None:
+                    break
+            time.sleep(delay)
+        if response.status_code == 304 and cached is None and method == "GET":
+            # Nothing cached to fill in an unsolicited 304; ask again without validators.
+            response = self._client.request(method, path, params=params)
         if response.status_code >= 400:
             self._raise_for_status(response)
-        return response
-
-    @staticmethod
-    def _raise_for_status(response: httpx.Response) -> None:
-        """Map HTTP error codes to SDK exceptions."""
-        status = response.status_code
-        detail: str | None = None
-        try:
-            body = response.json()
-            detail = body.get("message") or body.get("detail")
-        except Exception:
-            detail = response.text or None
-
-        message = detail or f"API request failed ({status})"
-
-        if status == 401:
-            raise AuthenticationError(message, status_code=status, detail=detail)
-        if status == 404:
-            raise NotFoundError(message, status_code=status, detail=detail)
-        if status == 422:
-            raise ValidationError(message, status_code=status, detail=detail)
-        if status >= 500:
-            raise ServerError(message, status_code=status, detail=detail)
-        raise AnclaError(message, status_code=status, detail=detail)
+        return self._revalidate(method, key, response, cached)
 
     def close(self) -> None:
         """Close the underlying HTTP client."""
@@ -120,22 +317,22 @@ class AnclaClient:
     def list_workspaces(self) -> list[Workspace]:
         """List all workspaces the authenticated user belongs to."""
         resp = self._request("GET", "/workspaces/")
-        return [Workspace.model_validate(item) for item in resp.json()]
+        return _WORKSPACE_LIST.validate_json(resp.content)
 
     def get_workspace(self, slug: str) -> Workspace:
         """Get details for a single workspace by slug."""
         resp = self._request("GET", f"/workspaces/{slug}")
-        return Workspace.model_validate(resp.json())
+        return Workspace.model_validate_json(resp.content)
 
     def create_workspace(self, name: str) -> Workspace:
         """Create a new workspace."""
         resp = self._request("POST", "/workspaces/", json={"name": name})
-        return Workspace.model_validate(resp.json())
+        return Workspace.model_validate_json(resp.content)
 
     def update_workspace(self, slug: str, name: str) -> Workspace:
         """Rename a workspace."""
         resp = self._request("PATCH", f"/workspaces/{slug}", json={"name": name})
-        return Workspace.model_validate(resp.json())
+        return Workspace.model_validate_json(resp.content)
 
     def delete_workspace(self, slug: str) -> None:
         """Delete a workspace by slug."""
@@ -148,22 +345,22 @@ class AnclaClient:
     def list_projects(self, ws: str) -> list[Project]:
         """List all projects in a workspace."""
         resp = self._request("GET", f"/workspaces/{ws}/projects/")
-        return [Project.model_validate(item) for item in resp.json()]
+        return _PROJECT_LIST.validate_json(resp.content)
 
     def get_project(self, ws: str, slug: str) -> Project:
         """Get details for a single project."""
         resp = self._request("GET", f"/workspaces/{ws}/projects/{slug}")
-        return Project.model_validate(resp.json())
+        return Project.model_validate_json(resp.content)
 
     def create_project(self, ws: str, name: str) -> Project:
         """Create a new project in a workspace."""
         resp = self._request("POST", f"/workspaces/{ws}/projects/", json={"name": name})
-        return Project.model_validate(resp.json())
+        return Project.model_validate_json(resp.content)
 
     def update_project(self, ws: str, slug: str, name: str) -> Project:
         """Rename a project."""
         resp = self._request("PATCH", f"/workspaces/{ws}/projects/{slug}", json={"name": name})
-        return Project.model_validate(resp.json())
+        return Project.model_validate_json(resp.content)
 
     def delete_project(self, ws: str, slug: str) -> None:
         """Delete a project."""
@@ -173,67 +370,66 @@ class AnclaClient:
     # Environments
     # ------------------------------------------------------------------
 
-    def _env_base(self, ws: str, proj: str) -> str:
-        return f"/workspaces/{ws}/projects/{proj}/envs"
-
     def list_envs(self, ws: str, proj: str) -> list[Environment]:
         """List all environments in a project."""
-        resp = self._request("GET", f"{self._env_base(ws, proj)}/")
-        return [Environment.model_validate(item) for item in resp.json()]
+        resp = self._request("GET", f"{_env_base(ws, proj)}/")
+        return _ENVIRONMENT_LIST.validate_json(resp.content)
 
     def get_env(self, ws: str, proj: str, slug: str) -> Environment:
         """Get details for a single environment."""
-        resp = self._request("GET", f"{self._env_base(ws, proj)}/{slug}")
-        return Environment.model_validate(resp.json())
+        resp = self._request("GET", f"{_env_base(ws, proj)}/{slug}")
+        return Environment.model_validate_json(resp.content)
 
     def create_env(self, ws: str, proj: str, name: str) -> Environment:
         """Create a new environment in a project."""
-        resp = self._request("POST", f"{self._env_base(ws, proj)}/", json={"name": name})
-        return Environment.model_validate(resp.json())
+        resp = self._request("POST", f"{_env_base(ws, proj)}/", json={"name": name})
+        return Environment.model_validate_json(resp.content)
 
     # ------------------------------------------------------------------
     # Services
     # ------------------------------------------------------------------
 
-    def _svc_base(self, ws: str, proj: str, env: str) -> str:
-        return f"/workspaces/{ws}/projects/{proj}/envs/{env}/services"
-
     def list_services(self, ws: str, proj: str, env: str) -> list[Service]:
         """List all services in an environment."""
-        resp = self._request("GET", f"{self._svc_base(ws, proj, env)}/")
-        return [Service.model_validate(item) for item in resp.json()]
+        resp = self._request("GET", f"{_svc_base(ws, proj, env)}/")
+        return _SERVICE_LIST.validate_json(resp.content)
 
     def get_service(self, ws: str, proj: str, env: str, slug: str) -> Service:
         """Get details for a single service."""
-        resp = self._request("GET", f"{self._svc_base(ws, proj, env)}/{slug}")
-        return Service.model_validate(resp.json())
+        resp = self._request("GET", f"{_svc_base(ws, proj, env)}/{slug}")
+        return Service.model_validate_json(resp.content)
 
     def create_service(self, ws: str, proj: str, env: str, name: str, platform: str) -> Service:
         """Create a new service in an environment."""
         resp = self._request(
             "POST",
-            f"{self._svc_base(ws, proj, env)}/",
+            f"{_svc_base(ws, proj, env)}/",
             json={"name": name, "platform": platform},
         )
-        return Service.model_validate(resp.json())
+        return Service.model_validate_json(resp.content)
 
     def update_service(self, ws: str, proj: str, env: str, slug: str, **kwargs: Any) -> Service:
-        """Update service attributes (name, platform, etc.)."""
+        """Update service attributes (name, platform, etc.).
+
+        Keyword arguments are checked against :class:`ServiceUpdate`, so an
+        unknown field raises ``pydantic.ValidationError`` before any request.
+        """
+        update = ServiceUpdate.model_validate(kwargs)
         resp = self._request(
             "PATCH",
-            f"{self._svc_base(ws, proj, env)}/{slug}",
-            json=kwargs,
+            f"{_svc_base(ws, proj, env)}/{slug}",
+            json=update.model_dump(exclude_unset=True),
         )
-        return Service.model_validate(resp.json())
+        return Service.model_validate_json(resp.content)
 
     def delete_service(self, ws: str, proj: str, env: str, slug: str) -> None:
         """Delete a service."""
-        self._request("DELETE", f"{self._svc_base(ws, proj, env)}/{slug}")
+        self._request("DELETE", f"{_svc_base(ws, proj, env)}/{slug}")
 
     def deploy_service(self, ws: str, proj: str, env: str, slug: str) -> DeployResult:
         """Trigger a full deploy for a service."""
-        resp = self._request("POST", f"{self._svc_base(ws, proj, env)}/{slug}/deploy")
-        return DeployResult.model_validate(resp.json())
+        resp = self._request("POST", f"{_svc_base(ws, proj, env)}/{slug}/deploy")
+        return DeployResult.model_validate_json(resp.content)
 
     def scale_service(
         self,
@@ -251,7 +447,7 @@ class AnclaClient:
         """
         self._request(
             "POST",
-            f"{self._svc_base(ws, proj, env)}/{slug}/scale",
+            f"{_svc_base(ws, proj, env)}/{slug}/scale",
             json={"process_counts": counts},
         )
 
@@ -261,19 +457,67 @@ class AnclaClient:
 
     def list_builds(self, ws: str, proj: str, env: str, svc: str) -> list[Build]:
         """List builds for a service."""
-        resp = self._request("GET", f"{self._svc_base(ws, proj, env)}/{svc}/builds/")
-        result = BuildList.model_validate(resp.json())
+        resp = self._request("GET", f"{_svc_base(ws, proj, env)}/{svc}/builds/")
+        result = BuildList.model_validate_json(resp.content)
         return result.items
 
+    def iter_builds(
+        self,
+        ws: str,
+        proj: str,
+        env: str,
+        svc: str,
+        per_page: int = _BUILDS_PER_PAGE,
+        prefetch: bool = False,
+    ) -> Iterator[Build]:
+        """Iterate over all builds for a service, fetching pages lazily.
+
+        Only one page of *per_page* builds is held at a time, and pages
+        after the one being consumed are not requested until needed.  With
+        *prefetch*, the next page is requested in a background thread while
+        the current one is consumed; stopping early then costs at most one
+        extra request.
+
+        Iteration ends on the first page shorter than *per_page*.  A
+        *per_page* above the API's default of 20 may be clamped by the
+        server, so the first page's length is used as the page size
+        instead; a page that repeats the previous one (a server ignoring
+        ``page``) also ends iteration.
+        """
+        path = f"{_svc_base(ws, proj, env)}/{svc}/builds/"
+
+        def fetch(page: int) -> list[Build]:
+            resp = self._request("GET", path, params={"page": page, "per_page": per_page})
+            return BuildList.model_validate_json(resp.content).items
+
+        pool = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page = 1
+            items = fetch(page)
+            page_size = per_page if per_page <= _BUILDS_PER_PAGE else len(items)
+            while True:
+                more = 0 < page_size <= len(items)
+                pending = pool.submit(fetch, page + 1) if pool and more else None
+                yield from items
+                if not more:
+                    return
+                page += 1
+                previous, items = items, pending.result() if pending else fetch(page)
+                if items and items[0] == previous[0]:
+                    return
+        finally:
+            if pool:
+                pool.shutdown(cancel_futures=True)
+
     def get_build(self, build_id: str) -> Build:
         """Get a single build by ID."""
         resp = self._request("GET", f"/builds/{build_id}")
-        return Build.model_validate(resp.json())
+        return Build.model_validate_json(resp.content)
 
     def get_build_log(self, build_id: str) -> DeployLog:
         """Get log output for a build."""
         resp = self._request("GET", f"/builds/{build_id}/log")
-        return DeployLog.model_validate(resp.json())
+        return DeployLog.model_validate_json(resp.content)
 
     # ------------------------------------------------------------------
     # Deploys
@@ -281,14 +525,14 @@ class AnclaClient:
 
     def list_deploys(self, ws: str, proj: str, env: str, svc: str) -> list[Deploy]:
         """List deploys for a service."""
-        resp = self._request("GET", f"{self._svc_base(ws, proj, env)}/{svc}/deploys/")
-        result = DeployList.model_validate(resp.json())
+        resp = self._request("GET", f"{_svc_base(ws, proj, env)}/{svc}/deploys/")
+        result = DeployList.model_validate_json(resp.content)
         return result.items
 
     def get_deploy(self, deploy_id: str) -> Deploy:
         """Get deploy details by ID."""
         resp = self._request("GET", f"/deploys/{deploy_id}/detail")
-        return Deploy.model_validate(resp.json())
+        return Deploy.model_validate_json(resp.content)
 
     # ------------------------------------------------------------------
     # Configuration
@@ -296,8 +540,8 @@ class AnclaClient:
 
     def list_config(self, ws: str, proj: str, env: str, svc: str) -> list[ConfigVar]:
         """List configuration variables for a service."""
-        resp = self._request("GET", f"{self._svc_base(ws, proj, env)}/{svc}/config/")
-        return [ConfigVar.model_validate(item) for item in resp.json()]
+        resp = self._request("GET", f"{_svc_base(ws, proj, env)}/{svc}/config/")
+        return _CONFIG_VAR_LIST.validate_json(resp.content)
 
     def set_config(
         self,
@@ -312,14 +556,353 @@ class AnclaClient:
         """Set (create or update) a configuration variable."""
         resp = self._request(
             "POST",
-            f"{self._svc_base(ws, proj, env)}/{svc}/config/",
+            f"{_svc_base(ws, proj, env)}/{svc}/config/",
             json={"name": key, "value": value, "secret": secret},
         )
-        return ConfigVar.model_validate(resp.json())
+        return ConfigVar.model_validate_json(resp.content)
 
     def delete_config(self, ws: str, proj: str, env: str, svc: str, key: str) -> None:
         """Delete a configuration variable."""
         self._request(
             "DELETE",
-            f"{self._svc_base(ws, proj, env)}/{svc}/config/{key}",
+            f"{_svc_base(ws, proj, env)}/{svc}/config/{key}",
+        )
+
+    def set_configs(
+        self,
+        ws: str,
+        proj: str,
+        env: str,
+        svc: str,
+        values: dict[str, str],
+        secret: bool = False,
+    ) -> list[ConfigVar]:
+        """Set several configuration variables, sending the requests concurrently.
+
+        Results are returned in the order of *values*.  If any request
+        fails, the first error is raised once the others have finished.
+        """
+        with ThreadPoolExecutor(max_workers=_FANOUT) as pool:
+            futures = [
+                pool.submit(self.set_config, ws, proj, env, svc, key, value, secret) for key, value in values.items()
+            ]
+        return [future.result() for future in futures]
+
+    def delete_configs(self, ws: str, proj: str, env: str, svc: str, keys: Iterable[str]) -> None:
+        """Delete several configuration variables, sending the requests concurrently.
+
+        If any request fails, the first error is raised once the others
+        have finished.
+        """
+        with ThreadPoolExecutor(max_workers=_FANOUT) as pool:
+            futures = [pool.submit(self.delete_config, ws, proj, env, svc, key) for key in keys]
+        for future in futures:
+            future.result()
+
+
+class AsyncAnclaClient(_BaseClient):
+    """Asynchronous client for the Ancla PaaS REST API.
+
+    Takes the same arguments as :class:`AnclaClient` (with an
+    ``httpx.AsyncBaseTransport`` for *transport*) and exposes the same
+    methods as coroutines, so independent calls can run concurrently::
+
+        async def main() -> None:
+            async with AsyncAnclaClient() as client:
+                builds = await asyncio.gather(*(client.get_build(b) for b in build_ids))
+
+        asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        server: str | None = None,
+        timeout: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+        max_retries: int = 2,
+    ) -> None:
+        super().__init__(api_key, server, max_retries)
+        self._client = httpx.AsyncClient(
+            transport=transport, http2=_HTTP2, limits=_LIMITS, **self._client_options(timeout)
+        )
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """Perform an HTTP request and raise on error status codes."""
+        key = str(httpx.URL(path, params=params))
+        cached, headers = self._conditional_headers(method, key)
+        content = None
+        if json is not None and _json_dumps is not None:
+            content, json, headers = _json_dumps(json), None, _JSON_HEADERS
+        for attempt in itertools.count():
+            try:
+                response = await self._client.request(
+                    method, path, content=content, json=json, params=params, headers=headers
+                )
+            except _CONNECT_ERRORS:
+                delay = self._retry_delay(method, None, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(method, response, attempt)
+                if delay is None:
+                    break
+            await _async_sleep(delay)
+        if response.status_code == 304 and cached is None and method == "GET":
+            # Nothing cached to fill in an unsolicited 304; ask again without validators.
+            response = await self._client.request(method, path, params=params)
+        if response.status_code >= 400:
+            self._raise_for_status(response)
+        return self._revalidate(method, key, response, cached)
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncAnclaClient:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    # ------------------------------------------------------------------
+    # Workspaces
+    # ------------------------------------------------------------------
+
+    async def list_workspaces(self) -> list[Workspace]:
+        """List all workspaces the authenticated user belongs to."""
+        resp = await self._request("GET", "/workspaces/")
+        return _WORKSPACE_LIST.validate_json(resp.content)
+
+    async def get_workspace(self, slug: str) -> Workspace:
+        """Get details for a single workspace by slug."""
+        resp = await self._request("GET", f"/workspaces/{slug}")
+        return Workspace.model_validate_json(resp.content)
+
+    async def create_workspace(self, name: str) -> Workspace:
+        """Create a new workspace."""
+        resp = await self._request("POST", "/workspaces/", json={"name": name})
+        return Workspace.model_validate_json(resp.content)
+
+    async def update_workspace(self, slug: str, name: str) -> Workspace:
+        """Rename a workspace."""
+        resp = await self._request("PATCH", f"/workspaces/{slug}", json={"name": name})
+        return Workspace.model_validate_json(resp.content)
+
+    async def delete_workspace(self, slug: str) -> None:
+        """Delete a workspace by slug."""
+        await self._request("DELETE", f"/workspaces/{slug}")
+
+    # ------------------------------------------------------------------
+    # Projects
+    # ------------------------------------------------------------------
+
+    async def list_projects(self, ws: str) -> list[Project]:
+        """List all projects in a workspace."""
+        resp = await self._request("GET", f"/workspaces/{ws}/projects/")
+        return _PROJECT_LIST.validate_json(resp.content)
+
+    async def get_project(self, ws: str, slug: str) -> Project:
+        """Get details for a single project."""
+        resp = await self._request("GET", f"/workspaces/{ws}/projects/{slug}")
+        return Project.model_validate_json(resp.content)
+
+    async def create_project(self, ws: str, name: str) -> Project:
+        """Create a new project in a workspace."""
+        resp = await self._request("POST", f"/workspaces/{ws}/projects/", json={"name": name})
+        return Project.model_validate_json(resp.content)
+
+    async def update_project(self, ws: str, slug: str, name: str) -> Project:
+        """Rename a project."""
+        resp = await self._request("PATCH", f"/workspaces/{ws}/projects/{slug}", json={"name": name})
+        return Project.model_validate_json(resp.content)
+
+    async def delete_project(self, ws: str, slug: str) -> None:
+        """Delete a project."""
+        await self._request("DELETE", f"/workspaces/{ws}/projects/{slug}")
+
+    # ------------------------------------------------------------------
+    # Environments
+    # ------------------------------------------------------------------
+
+    async def list_envs(self, ws: str, proj: str) -> list[Environment]:
+        """List all environments in a project."""
+        resp = await self._request("GET", f"{_env_base(ws, proj)}/")
+        return _ENVIRONMENT_LIST.validate_json(resp.content)
+
+    async def get_env(self, ws: str, proj: str, slug: str) -> Environment:
+        """Get details for a single environment."""
+        resp = await self._request("GET", f"{_env_base(ws, proj)}/{slug}")
+        return Environment.model_validate_json(resp.content)
+
+    async def create_env(self, ws: str, proj: str, name: str) -> Environment:
+        """Create a new environment in a project."""
+        resp = await self._request("POST", f"{_env_base(ws, proj)}/", json={"name": name})
+        return Environment.model_validate_json(resp.content)
+
+    # ------------------------------------------------------------------
+    # Services
+    # ------------------------------------------------------------------
+
+    async def list_services(self, ws: str, proj: str, env: str) -> list[Service]:
+        """List all services in an environment."""
+        resp = await self._request("GET", f"{_svc_base(ws, proj, env)}/")
+        return _SERVICE_LIST.validate_json(resp.content)
+
+    async def get_service(self, ws: str, proj: str, env: str, slug: str) -> Service:
+        """Get details for a single service."""
+        resp = await self._request("GET", f"{_svc_base(ws, proj, env)}/{slug}")
+        return Service.model_validate_json(resp.content)
+
+    async def create_service(self, ws: str, proj: str, env: str, name: str, platform: str) -> Service:
+        """Create a new service in an environment."""
+        resp = await self._request(
+            "POST",
+            f"{_svc_base(ws, proj, env)}/",
+            json={"name": name, "platform": platform},
+        )
+        return Service.model_validate_json(resp.content)
+
+    async def update_service(self, ws: str, proj: str, env: str, slug: str, **kwargs: Any) -> Service:
+        """Update service attributes (name, platform, etc.).
+
+        Keyword arguments are checked against :class:`ServiceUpdate`, so an
+        unknown field raises ``pydantic.ValidationError`` before any request.
+        """
+        update = ServiceUpdate.model_validate(kwargs)
+        resp = await self._request(
+            "PATCH",
+            f"{_svc_base(ws, proj, env)}/{slug}",
+            json=update.model_dump(exclude_unset=True),
+        )
+        return Service.model_validate_json(resp.content)
+
+    async def delete_service(self, ws: str, proj: str, env: str, slug: str) -> None:
+        """Delete a service."""
+        await self._request("DELETE", f"{_svc_base(ws, proj, env)}/{slug}")
+
+    async def deploy_service(self, ws: str, proj: str, env: str, slug: str) -> DeployResult:
+        """Trigger a full deploy for a service."""
+        resp = await self._request("POST", f"{_svc_base(ws, proj, env)}/{slug}/deploy")
+        return DeployResult.model_validate_json(resp.content)
+
+    async def scale_service(
+        self,
+        ws: str,
+        proj: str,
+        env: str,
+        slug: str,
+        counts: dict[str, int],
+    ) -> None:
+        """Scale service processes.
+
+        Args:
+            counts: Mapping of process name to desired count,
+                e.g. ``{"web": 2, "worker": 1}``.
+        """
+        await self._request(
+            "POST",
+            f"{_svc_base(ws, proj, env)}/{slug}/scale",
+            json={"process_counts": counts},
+        )
+
+    # ------------------------------------------------------------------
+    # Builds
+    # ------------------------------------------------------------------
+
+    async def list_builds(self, ws: str, proj: str, env: str, svc: str) -> list[Build]:
+        """List builds for a service."""
+        resp = await self._request("GET", f"{_svc_base(ws, proj, env)}/{svc}/builds/")
+        result = BuildList.model_validate_json(resp.content)
+        return result.items
+
+    async def iter_builds(
+        self, ws: str, proj: str, env: str, svc: str, per_page: int = _BUILDS_PER_PAGE
+    ) -> AsyncIterator[Build]:
+        """Iterate over all builds for a service, fetching pages lazily.
+
+        Pages end iteration under the same rules as :meth:`AnclaClient.iter_builds`.
+        """
+        path = f"{_svc_base(ws, proj, env)}/{svc}/builds/"
+        page = 1
+        page_size = per_page if per_page <= _BUILDS_PER_PAGE else None
+        previous: list[Build] = []
+        while True:
+            resp = await self._request("GET", path, params={"page": page, "per_page": per_page})
+            items = BuildList.model_validate_json(resp.content).items
+            if items and previous and items[0] == previous[0]:
+                return
+            if page_size is None:
+                page_size = len(items)
+            for build in items:
+                yield build
+            if not 0 < page_size <= len(items):
+                return
+            page += 1
+            previous = items
+
+    async def get_build(self, build_id: str) -> Build:
+        """Get a single build by ID."""
+        resp = await self._request("GET", f"/builds/{build_id}")
+        return Build.model_validate_json(resp.content)
+
+    async def get_build_log(self, build_id: str) -> DeployLog:
+        """Get log output for a build."""
+        resp = await self._request("GET", f"/builds/{build_id}/log")
+        return DeployLog.model_validate_json(resp.content)
+
+    # ------------------------------------------------------------------
+    # Deploys
+    # ------------------------------------------------------------------
+
+    async def list_deploys(self, ws: str, proj: str, env: str, svc: str) -> list[Deploy]:
+        """List deploys for a service."""
+        resp = await self._request("GET", f"{_svc_base(ws, proj, env)}/{svc}/deploys/")
+        result = DeployList.model_validate_json(resp.content)
+        return result.items
+
+    async def get_deploy(self, deploy_id: str) -> Deploy:
+        """Get deploy details by ID."""
+        resp = await self._request("GET", f"/deploys/{deploy_id}/detail")
+        return Deploy.model_validate_json(resp.content)
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+
+    async def list_config(self, ws: str, proj: str, env: str, svc: str) -> list[ConfigVar]:
+        """List configuration variables for a service."""
+        resp = await self._request("GET", f"{_svc_base(ws, proj, env)}/{svc}/config/")
+        return _CONFIG_VAR_LIST.validate_json(resp.content)
+
+    async def set_config(
+        self,
+        ws: str,
+        proj: str,
+        env: str,
+        svc: str,
+        key: str,
+        value: str,
+        secret: bool = False,
+    ) -> ConfigVar:
+        """Set (create or update) a configuration variable."""
+        resp = await self._request(
+            "POST",
+            f"{_svc_base(ws, proj, env)}/{svc}/config/",
+            json={"name": key, "value": value, "secret": secret},
+        )
+        return ConfigVar.model_validate_json(resp.content)
+
+    async def delete_config(self, ws: str, proj: str, env: str, svc: str, key: str) -> None:
+        """Delete a configuration variable."""
+        await self._request(
+            "DELETE",
+            f"{_svc_base(ws, proj, env)}/{svc}/config/{key}",
         )
@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class _Model(BaseModel):
+    """Base for all SDK models.
+
+    Validators are built on first use rather than at import, so importing
+    the SDK only pays for the models a script actually touches.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
 
 # ---------------------------------------------------------------------------
 # Workspaces
 # ---------------------------------------------------------------------------
 
 
-class WorkspaceMember(BaseModel):
+class WorkspaceMember(_Model):
     """A member of a workspace."""
 
     username: str
@@ -17,7 +28,7 @@ class WorkspaceMember(BaseModel):
     admin: bool = False
 
 
-class Workspace(BaseModel):
+class Workspace(_Model):
     """An Ancla workspace (formerly organization)."""
 
     id: str = ""
@@ -34,7 +45,7 @@ class Workspace(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class Project(BaseModel):
+class Project(_Model):
     """A project within a workspace."""
 
     id: str = ""
@@ -52,7 +63,7 @@ class Project(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class Environment(BaseModel):
+class Environment(_Model):
     """An environment within a project (e.g. production, staging)."""
 
     id: str = ""
@@ -67,7 +78,7 @@ class Environment(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class Service(BaseModel):
+class Service(_Model):
     """A service within an environment (formerly application)."""
 
     id: str = ""
@@ -79,12 +90,23 @@ class Service(BaseModel):
     process_counts: dict[str, int] = Field(default_factory=dict)
 
 
+class ServiceUpdate(_Model):
+    """Fields accepted when updating a service; only the ones set are sent."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    name: str | None = None
+    platform: str | None = None
+    github_repository: str | None = None
+    auto_deploy_branch: str | None = None
+
+
 # ---------------------------------------------------------------------------
 # Builds
 # ---------------------------------------------------------------------------
 
 
-class Build(BaseModel):
+class Build(_Model):
     """A container build for a service (formerly image)."""
 
     id: str = ""
@@ -94,7 +116,7 @@ class Build(BaseModel):
     created: str = ""
 
 
-class BuildList(BaseModel):
+class BuildList(_Model):
     """Paginated wrapper returned by the builds list endpoint."""
 
     items: list[Build] = Field(default_factory=list)
@@ -105,7 +127,7 @@ class BuildList(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class Deploy(BaseModel):
+class Deploy(_Model):
     """A deploy combining build and rollout (formerly release + deployment)."""
 
     id: str = ""
@@ -117,14 +139,14 @@ class Deploy(BaseModel):
     updated: str = ""
 
 
-class DeployLog(BaseModel):
+class DeployLog(_Model):
     """Log output for a deploy."""
 
     status: str = ""
     log_text: str = ""
 
 
-class DeployList(BaseModel):
+class DeployList(_Model):
     """Paginated wrapper returned by the deploys list endpoint."""
 
     items: list[Deploy] = Field(default_factory=list)
@@ -135,7 +157,7 @@ class DeployList(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class ConfigVar(BaseModel):
+class ConfigVar(_Model):
     """A configuration variable attached to a service."""
 
     id: str = ""
@@ -150,13 +172,13 @@ class ConfigVar(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class StageStatus(BaseModel):
+class StageStatus(_Model):
     """Status of a single pipeline stage."""
 
     status: str = ""
 
 
-class PipelineStatus(BaseModel):
+class PipelineStatus(_Model):
     """Status of the build/deploy pipeline (no release stage)."""
 
     build: StageStatus | None = None
@@ -168,17 +190,17 @@ class PipelineStatus(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class DeployResult(BaseModel):
+class DeployResult(_Model):
     """Response from triggering a deploy."""
 
     build_id: str = ""
 
 
-class ScaleResult(BaseModel):
+class ScaleResult(_Model):
     """Response from a scale operation (empty on success)."""
 
 
-class BuildResult(BaseModel):
+class BuildResult(_Model):
     """Response from creating a build."""
 
     build_id: str = ""
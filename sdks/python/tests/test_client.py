@@ -3,21 +3,28 @@
 from __future__ import annotations
 
 import json
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
 
+import httpx
 import pytest
-from pytest_httpx import HTTPXMock
+from pydantic import ValidationError as PydanticValidationError
 
 from ancla import (
     AnclaClient,
     AnclaError,
+    AsyncAnclaClient,
     AuthenticationError,
-    Build,
-    Deploy,
     NotFoundError,
     ServerError,
-    Service,
-    Workspace,
 )
+from ancla import ValidationError as AnclaValidationError
+
+if TYPE_CHECKING:
+    from pytest_httpx import HTTPXMock
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -26,11 +33,35 @@ from ancla import (
 SERVER = "https://test.ancla.dev"
 API_KEY = "test-key-abc123"
 
+# Mocked endpoint URLs shared across tests.
+API_URL = f"{SERVER}/api/v1"
+WORKSPACES_URL = f"{API_URL}/workspaces/"
+SERVICES_URL = f"{API_URL}/workspaces/acme/projects/web/envs/production/services/"
+SERVICE_URL = f"{SERVICES_URL}web-api"
+BUILDS_URL = f"{SERVICE_URL}/builds/"
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[AnclaClient]:
+    """Return a client pointed at a fake server, shared by the whole session.
+
+    Tests that depend on the client's conditional-GET cache build their own.
+    """
+    with AnclaClient(api_key=API_KEY, server=SERVER) as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _clear_conditional_cache(client: AnclaClient) -> Iterator[None]:
+    """Drop responses the shared client cached, so no test sees another's ETags."""
+    yield
+    client._conditional.clear()
+
 
 @pytest.fixture()
-def client() -> AnclaClient:
-    """Return a client pointed at a fake server."""
-    return AnclaClient(api_key=API_KEY, server=SERVER)
+def anyio_backend() -> str:
+    """Run async tests on asyncio only; trio is not a dev dependency."""
+    return "asyncio"
 
 
 # ---------------------------------------------------------------------------
@@ -41,32 +72,64 @@ def client() -> AnclaClient:
 class TestClientInit:
     """Verify constructor defaults and env-var fallback."""
 
-    def test_default_server(self) -> None:
-        c = AnclaClient(api_key="k")
-        assert c.server == "https://ancla.dev"
+    @pytest.mark.parametrize(
+        ("env", "kwargs", "attr", "expected"),
+        [
+            ({}, {"api_key": "k"}, "server", "https://ancla.dev"),
+            ({}, {"api_key": "k", "server": "https://example.com/"}, "server", "https://example.com"),
+            ({"ANCLA_API_KEY": "env-key"}, {}, "api_key", "env-key"),
+            ({"ANCLA_SERVER": "https://env.ancla.dev"}, {"api_key": "k"}, "server", "https://env.ancla.dev"),
+            ({"ANCLA_API_KEY": "env-key"}, {"api_key": "explicit-key"}, "api_key", "explicit-key"),
+        ],
+        ids=[
+            "default_server",
+            "custom_server_strips_trailing_slash",
+            "api_key_from_env",
+            "server_from_env",
+            "explicit_overrides_env",
+        ],
+    )
+    def test_config_resolution(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        env: dict[str, str],
+        kwargs: dict[str, str],
+        attr: str,
+        expected: str,
+    ) -> None:
+        monkeypatch.delenv("ANCLA_API_KEY", raising=False)
+        monkeypatch.delenv("ANCLA_SERVER", raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        with AnclaClient(**kwargs) as client:
+            assert getattr(client, attr) == expected
 
-    def test_custom_server_strips_trailing_slash(self) -> None:
-        c = AnclaClient(api_key="k", server="https://example.com/")
-        assert c.server == "https://example.com"
+    def test_context_manager(self) -> None:
+        with AnclaClient(api_key="k") as c:
+            assert c.api_key == "k"
 
-    def test_api_key_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setenv("ANCLA_API_KEY", "env-key")
-        c = AnclaClient()
-        assert c.api_key == "env-key"
+    def test_custom_transport(self) -> None:
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+        with AnclaClient(api_key="k", server=SERVER, transport=transport) as c:
+            assert c.list_workspaces() == []
 
-    def test_server_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setenv("ANCLA_SERVER", "https://env.ancla.dev")
-        c = AnclaClient(api_key="k")
-        assert c.server == "https://env.ancla.dev"
+    def test_proxy_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+        with AnclaClient(api_key="k", server=SERVER) as c:
+            assert "https://" in {pattern.pattern for pattern in c._client._mounts}
 
-    def test_explicit_overrides_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setenv("ANCLA_API_KEY", "env-key")
-        c = AnclaClient(api_key="explicit-key")
-        assert c.api_key == "explicit-key"
 
-    def test_context_manager(self) -> None:
-        with AnclaClient(api_key="k") as c:
-            assert c.api_key == "k"
+# ---------------------------------------------------------------------------
+# Package
+# ---------------------------------------------------------------------------
+
+
+class TestPackage:
+    """The lazy package namespace still exposes the submodules."""
+
+    def test_submodules_reachable_after_bare_import(self) -> None:
+        code = "import ancla; ancla.models.Build; ancla.client.AnclaClient; ancla.exceptions.AnclaError"
+        subprocess.run([sys.executable, "-c", code], check=True)
 
 
 # ---------------------------------------------------------------------------
@@ -89,14 +152,13 @@ class TestWorkspaces:
             },
         ]
         httpx_mock.add_response(
-            url=f"{SERVER}/api/v1/workspaces/",
+            url=WORKSPACES_URL,
             method="GET",
             json=payload,
         )
 
         workspaces = client.list_workspaces()
         assert len(workspaces) == 1
-        assert isinstance(workspaces[0], Workspace)
         assert workspaces[0].slug == "acme"
         assert workspaces[0].member_count == 3
         assert workspaces[0].service_count == 5
@@ -113,7 +175,7 @@ class TestWorkspaces:
             ],
         }
         httpx_mock.add_response(
-            url=f"{SERVER}/api/v1/workspaces/acme",
+            url=f"{API_URL}/workspaces/acme",
             method="GET",
             json=payload,
         )
@@ -126,7 +188,7 @@ class TestWorkspaces:
     def test_create_workspace(self, client: AnclaClient, httpx_mock: HTTPXMock) -> None:
         payload = {"id": "ws-new", "name": "NewWS", "slug": "newws"}
         httpx_mock.add_response(
-            url=f"{SERVER}/api/v1/workspaces/",
+            url=WORKSPACES_URL,
             method="POST",
             json=payload,
         )
@@ -152,19 +214,31 @@ class TestServices:
             {"name": "Web API", "slug": "web-api", "platform": "docker"},
         ]
         httpx_mock.add_response(
-            url=f"{SERVER}/api/v1/workspaces/acme/projects/web/envs/production/services/",
+            url=SERVICES_URL,
             method="GET",
             json=payload,
         )
 
         services = client.list_services("acme", "web", "production")
         assert len(services) == 1
-        assert isinstance(services[0], Service)
         assert services[0].platform == "docker"
 
+    def test_update_service_sends_only_given_fields(self, client: AnclaClient, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url=SERVICE_URL,
+            method="PATCH",
+            json={"name": "API", "slug": "web-api"},
+        )
+
+        client.update_service("acme", "web", "production", "web-api", name="API")
+        assert json.loads(httpx_mock.get_requests()[0].content) == {"name": "API"}
+
+        with pytest.raises(PydanticValidationError):
+            client.update_service("acme", "web", "production", "web-api", nmae="typo")
+
     def test_deploy_service(self, client: AnclaClient, httpx_mock: HTTPXMock) -> None:
         httpx_mock.add_response(
-            url=f"{SERVER}/api/v1/workspaces/acme/projects/web/envs/production/services/web-api/deploy",
+            url=f"{SERVICE_URL}/deploy",
             method="POST",
             json={"build_id": "bld-123"},
         )
@@ -194,16 +268,111 @@ class TestBuilds:
             ],
         }
         httpx_mock.add_response(
-            url=f"{SERVER}/api/v1/workspaces/acme/projects/web/envs/production/services/web-api/builds/",
+            url=BUILDS_URL,
             method="GET",
             json=payload,
         )
 
         builds = client.list_builds("acme", "web", "production", "web-api")
         assert len(builds) == 1
-        assert isinstance(builds[0], Build)
         assert builds[0].built is True
 
+    def test_iter_builds_pages_lazily(self, client: AnclaClient, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url=f"{BUILDS_URL}?page=1&per_page=2",
+            json={"items": [{"id": "b-1", "version": 1}, {"id": "b-2", "version": 2}]},
+        )
+        httpx_mock.add_response(
+            url=f"{BUILDS_URL}?page=2&per_page=2",
+            json={"items": [{"id": "b-3", "version": 3}]},
+        )
+
+        builds = client.iter_builds("acme", "web", "production", "web-api", per_page=2)
+        assert next(builds).id == "b-1"
+        assert len(httpx_mock.get_requests()) == 1
+        assert [b.id for b in builds] == ["b-2", "b-3"]
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_iter_builds_prefetch(self, client: AnclaClient, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url=f"{BUILDS_URL}?page=1&per_page=1",
+            json={"items": [{"id": "b-1", "version": 1}]},
+        )
+        httpx_mock.add_response(
+            url=f"{BUILDS_URL}?page=2&per_page=1",
+            json={"items": []},
+        )
+
+        builds = client.iter_builds("acme", "web", "production", "web-api", per_page=1, prefetch=True)
+        assert [b.id for b in builds] == ["b-1"]
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_iter_builds_with_clamped_page_size(self, client: AnclaClient, httpx_mock: HTTPXMock) -> None:
+        # The server caps pages at 2 builds, below the requested per_page.
+        for page, ids in enumerate((["b-1", "b-2"], ["b-3", "b-4"], ["b-5"]), start=1):
+            httpx_mock.add_response(
+                url=f"{BUILDS_URL}?page={page}&per_page=100",
+                json={"items": [{"id": build_id, "version": 1} for build_id in ids]},
+            )
+
+        builds = client.iter_builds("acme", "web", "production", "web-api", per_page=100)
+        assert [b.id for b in builds] == ["b-1", "b-2", "b-3", "b-4", "b-5"]
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_iter_builds_single_short_page(self, client: AnclaClient, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url=f"{BUILDS_URL}?page=1&per_page=20",
+            json={"items": [{"id": f"b-{n}", "version": n} for n in range(1, 4)]},
+        )
+
+        builds = client.iter_builds("acme", "web", "production", "web-api")
+        assert [b.id for b in builds] == ["b-1", "b-2", "b-3"]
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_iter_builds_stops_when_server_ignores_page(self, client: AnclaClient, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            json={"items": [{"id": "b-1", "version": 1}, {"id": "b-2", "version": 2}]},
+            is_reusable=True,
+        )
+
+        builds = client.iter_builds("acme", "web", "production", "web-api", per_page=2)
+        assert [b.id for b in builds] == ["b-1", "b-2"]
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_conditional_get_reuses_cached_response(self, httpx_mock: HTTPXMock) -> None:
+        url = f"{API_URL}/builds/bld-1"
+        httpx_mock.add_response(url=url, headers={"ETag": '"v1"'}, json={"id": "bld-1", "built": False})
+        httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"v1"'})
+
+        with AnclaClient(api_key=API_KEY, server=SERVER) as client:
+            assert client.get_build("bld-1").id == "bld-1"
+            assert client.get_build("bld-1").id == "bld-1"
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.parametrize("method", ["POST", "PATCH"])
+    def test_304_on_write_is_not_resent(self, client: AnclaClient, httpx_mock: HTTPXMock, method: str) -> None:
+        httpx_mock.add_response(url=SERVICE_URL, method=method, status_code=304)
+
+        response = client._request(method, "/workspaces/acme/projects/web/envs/production/services/web-api", json={})
+        assert response.status_code == 304
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_conditional_get_survives_eviction(self, httpx_mock: HTTPXMock) -> None:
+        url = f"{API_URL}/builds/bld-1"
+        httpx_mock.add_response(url=url, headers={"ETag": '"v1"'}, json={"id": "bld-1", "built": False})
+
+        with AnclaClient(api_key=API_KEY, server=SERVER) as client:
+
+            def not_modified(request: httpx.Request) -> httpx.Response:
+                # Another thread evicts the entry while the request is in flight.
+                client._conditional.clear()
+                return httpx.Response(304)
+
+            httpx_mock.add_callback(not_modified, url=url, match_headers={"If-None-Match": '"v1"'})
+            assert client.get_build("bld-1").id == "bld-1"
+            assert client.get_build("bld-1").id == "bld-1"
+        assert len(httpx_mock.get_requests()) == 2
+
 
 # ---------------------------------------------------------------------------
 # Deploys
@@ -224,17 +393,60 @@ class TestDeploys:
             "updated": "2025-01-01",
         }
         httpx_mock.add_response(
-            url=f"{SERVER}/api/v1/deploys/dpl-1/detail",
+            url=f"{API_URL}/deploys/dpl-1/detail",
             method="GET",
             json=payload,
         )
 
         deploy = client.get_deploy("dpl-1")
-        assert isinstance(deploy, Deploy)
         assert deploy.complete is True
         assert deploy.job_id == "job-abc"
 
 
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+
+class TestConfig:
+    """Cover the bulk configuration helpers."""
+
+    def test_set_configs(self, client: AnclaClient, httpx_mock: HTTPXMock) -> None:
+        def echo(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(201, json=json.loads(request.content))
+
+        httpx_mock.add_callback(
+            echo,
+            url=f"{SERVICE_URL}/config/",
+            method="POST",
+            is_reusable=True,
+        )
+
+        values = {"A": "1", "B": "2", "C": "3"}
+        result = client.set_configs("acme", "web", "production", "web-api", values)
+        assert [(v.name, v.value) for v in result] == list(values.items())
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_delete_configs_raises_after_all_requests(self, client: AnclaClient, httpx_mock: HTTPXMock) -> None:
+        deleted = []
+
+        def delete(request: httpx.Request) -> httpx.Response:
+            key = request.url.path.rsplit("/", 1)[-1]
+            if key == "B":
+                return httpx.Response(404, json={"detail": "Config var not found"})
+            time.sleep(0.05)
+            deleted.append(key)
+            return httpx.Response(204)
+
+        httpx_mock.add_callback(delete, method="DELETE", is_reusable=True)
+
+        with pytest.raises(NotFoundError) as exc_info:
+            client.delete_configs("acme", "web", "production", "web-api", ["A", "B", "C"])
+        assert "Config var not found" in str(exc_info.value)
+        assert sorted(deleted) == ["A", "C"]
+        assert len(httpx_mock.get_requests()) == 3
+
+
 # ---------------------------------------------------------------------------
 # Error handling
 # ---------------------------------------------------------------------------
@@ -245,27 +457,29 @@ class TestErrors:
 
     def test_401_raises_authentication_error(self, client: AnclaClient, httpx_mock: HTTPXMock) -> None:
         httpx_mock.add_response(
-            url=f"{SERVER}/api/v1/workspaces/",
+            url=WORKSPACES_URL,
             status_code=401,
             json={"message": "Invalid API key"},
         )
 
-        with pytest.raises(AuthenticationError, match="Invalid API key"):
+        with pytest.raises(AuthenticationError) as exc_info:
             client.list_workspaces()
+        assert "Invalid API key" in str(exc_info.value)
 
     def test_404_raises_not_found_error(self, client: AnclaClient, httpx_mock: HTTPXMock) -> None:
         httpx_mock.add_response(
-            url=f"{SERVER}/api/v1/workspaces/missing",
+            url=f"{API_URL}/workspaces/missing",
             status_code=404,
             json={"detail": "Workspace not found"},
         )
 
-        with pytest.raises(NotFoundError, match="Workspace not found"):
+        with pytest.raises(NotFoundError) as exc_info:
             client.get_workspace("missing")
+        assert "Workspace not found" in str(exc_info.value)
 
     def test_500_raises_server_error(self, client: AnclaClient, httpx_mock: HTTPXMock) -> None:
         httpx_mock.add_response(
-            url=f"{SERVER}/api/v1/workspaces/",
+            url=WORKSPACES_URL,
             status_code=500,
             text="Internal Server Error",
         )
@@ -274,34 +488,152 @@ class TestErrors:
             client.list_workspaces()
 
     def test_422_raises_validation_error(self, client: AnclaClient, httpx_mock: HTTPXMock) -> None:
-        from ancla import ValidationError as AnclaValidationError
-
         httpx_mock.add_response(
-            url=f"{SERVER}/api/v1/workspaces/",
+            url=WORKSPACES_URL,
             method="POST",
             status_code=422,
             json={"detail": "Name is required"},
         )
 
-        with pytest.raises(AnclaValidationError, match="Name is required"):
+        with pytest.raises(AnclaValidationError) as exc_info:
             client.create_workspace("")
+        assert "Name is required" in str(exc_info.value)
 
     def test_generic_4xx_raises_ancla_error(self, client: AnclaClient, httpx_mock: HTTPXMock) -> None:
         httpx_mock.add_response(
-            url=f"{SERVER}/api/v1/workspaces/",
+            url=WORKSPACES_URL,
             status_code=429,
+            headers={"Retry-After": "0"},
             json={"message": "Rate limited"},
+            is_reusable=True,
         )
 
-        with pytest.raises(AnclaError, match="Rate limited"):
+        with pytest.raises(AnclaError) as exc_info:
             client.list_workspaces()
+        assert "Rate limited" in str(exc_info.value)
+        assert len(httpx_mock.get_requests()) == 1 + client.max_retries
+
+    def test_retries_transient_gateway_error(
+        self, client: AnclaClient, httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("ancla.client.time.sleep", lambda delay: None)
+        httpx_mock.add_response(url=WORKSPACES_URL, status_code=503)
+        httpx_mock.add_response(url=WORKSPACES_URL, json=[])
+
+        assert client.list_workspaces() == []
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_retries_connect_error(
+        self, client: AnclaClient, httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("ancla.client.time.sleep", lambda delay: None)
+        httpx_mock.add_exception(httpx.ConnectError("Connection refused"), url=WORKSPACES_URL)
+        httpx_mock.add_response(url=WORKSPACES_URL, method="POST", json={"name": "Acme", "slug": "acme"})
+
+        assert client.create_workspace("Acme").slug == "acme"
+        assert len(httpx_mock.get_requests()) == 2
 
     def test_auth_header_sent(self, client: AnclaClient, httpx_mock: HTTPXMock) -> None:
         httpx_mock.add_response(
-            url=f"{SERVER}/api/v1/workspaces/",
+            url=WORKSPACES_URL,
             json=[],
         )
 
         client.list_workspaces()
         request = httpx_mock.get_requests()[0]
         assert request.headers["X-API-Key"] == API_KEY
+        assert request.headers["Accept"] == "application/json"
+        assert "gzip" in request.headers["Accept-Encoding"]
+
+    def test_no_auth_header_without_key(self, monkeypatch: pytest.MonkeyPatch, httpx_mock: HTTPXMock) -> None:
+        monkeypatch.delenv("ANCLA_API_KEY", raising=False)
+        httpx_mock.add_response(
+            url=WORKSPACES_URL,
+            json=[],
+        )
+
+        with AnclaClient(server=SERVER) as client:
+            client.list_workspaces()
+        request = httpx_mock.get_requests()[0]
+        assert "X-API-Key" not in request.headers
+
+
+# ---------------------------------------------------------------------------
+# Async client
+# ---------------------------------------------------------------------------
+
+
+class TestAsyncClient:
+    """The async client shares configuration and error mapping with the sync one."""
+
+    @pytest.mark.anyio
+    async def test_list_workspaces(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url=WORKSPACES_URL,
+            method="GET",
+            json=[{"id": "ws-1", "name": "Acme", "slug": "acme"}],
+        )
+
+        async with AsyncAnclaClient(api_key=API_KEY, server=SERVER) as client:
+            workspaces = await client.list_workspaces()
+        assert workspaces[0].slug == "acme"
+        assert httpx_mock.get_requests()[0].headers["X-API-Key"] == API_KEY
+
+    @pytest.mark.anyio
+    async def test_404_raises_not_found_error(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url=f"{API_URL}/workspaces/missing",
+            status_code=404,
+            json={"detail": "Workspace not found"},
+        )
+
+        async with AsyncAnclaClient(api_key=API_KEY, server=SERVER) as client:
+            with pytest.raises(NotFoundError) as exc_info:
+                await client.get_workspace("missing")
+            assert "Workspace not found" in str(exc_info.value)
+
+    @pytest.mark.anyio
+    async def test_iter_builds(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url=f"{BUILDS_URL}?page=1&per_page=2",
+            json={"items": [{"id": "b-1", "version": 1}, {"id": "b-2", "version": 2}]},
+        )
+        httpx_mock.add_response(
+            url=f"{BUILDS_URL}?page=2&per_page=2",
+            json={"items": [{"id": "b-3", "version": 3}]},
+        )
+
+        async with AsyncAnclaClient(api_key=API_KEY, server=SERVER) as client:
+            builds = [b.id async for b in client.iter_builds("acme", "web", "production", "web-api", per_page=2)]
+        assert builds == ["b-1", "b-2", "b-3"]
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.anyio
+    async def test_retries_transient_gateway_error(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=WORKSPACES_URL, status_code=503, headers={"Retry-After": "0"})
+        httpx_mock.add_response(url=WORKSPACES_URL, json=[])
+
+        async with AsyncAnclaClient(api_key=API_KEY, server=SERVER) as client:
+            assert await client.list_workspaces() == []
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.anyio
+    async def test_conditional_get_reuses_cached_response(self, httpx_mock: HTTPXMock) -> None:
+        url = f"{API_URL}/builds/bld-1"
+        httpx_mock.add_response(url=url, headers={"ETag": '"v1"'}, json={"id": "bld-1", "built": False})
+        httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"v1"'})
+
+        async with AsyncAnclaClient(api_key=API_KEY, server=SERVER) as client:
+            assert (await client.get_build("bld-1")).id == "bld-1"
+            assert (await client.get_build("bld-1")).id == "bld-1"
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.anyio
+    async def test_create_workspace_sends_json_body(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=WORKSPACES_URL, method="POST", json={"name": "Acme", "slug": "acme"})
+
+        async with AsyncAnclaClient(api_key=API_KEY, server=SERVER) as client:
+            assert (await client.create_workspace("Acme")).slug == "acme"
+        request = httpx_mock.get_requests()[0]
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {"name": "Acme"}